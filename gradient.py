@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import tinycss2
+import re
 from collections import namedtuple
 
 # extract palettes: https://colorpalettefromimage.com/
@@ -16,27 +16,19 @@ emp = """
 
 Color = namedtuple('Color', 'r g b a o')
 
-def split_into_elements(full_text):
-    s = full_text.replace('\n', '')
-    s = s.replace(' ', '')
-    return s.split('%,')
+# rgba(230,239,245,1) 15%
+_RGBA_RE = re.compile(
+    r'rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)\s*(\d+)\s*%')
 
-def strip_chars(color):
-    # rgba(230,239,245,1)15
-    s = color.replace('%', '')
-    s = s.replace('rgba(', '')
-    s = s.replace(')', ',')
-    sz = s.split(',')
-
-    c = Color(int(sz[0]), int(sz[1]), int(sz[2]), int(sz[3]), int(int(sz[4]) / 100 * 255))
-    return c
-
-def convert_to_c_array(color):
-    return f'{color.o}, 0x{color.r:02x}, 0x{color.g:02x}, 0x{color.b:02x},\n'
+def parse_stops(css):
+    stops = _RGBA_RE.findall(css)
+    # every "N%" must belong to a stop we could parse
+    assert len(stops) == css.count('%'), "Unrecognized color stop"
+    return [Color(int(r), int(g), int(b), int(a), int(int(o) / 100 * 255))
+            for r, g, b, a, o in stops]
 
 def convert_css_into_c_array(css):
-    elements = split_into_elements(css)
-    colors = [strip_chars(c) for c in elements]
+    colors = parse_stops(css)
     if colors[0].o != 0:
         assert False, "Must begin with 0"
     if colors[-1].o != 255:
@@ -47,14 +39,14 @@ def convert_css_into_c_array(css):
         #assert False, "Must start and end the same"
         pass
     
-    result_str = '{\n'
+    parts = ['{\n']
     for c in colors:
-        result_str += "    " + convert_to_c_array(c)
+        parts.append(f'    {c.o}, 0x{c.r:02x}, 0x{c.g:02x}, 0x{c.b:02x},\n')
 
     # remove the last comma
-    result_str = (result_str[:-2])
-    result_str += '\n};\n'
-    return result_str
+    parts[-1] = parts[-1][:-2]
+    parts.append('\n};\n')
+    return ''.join(parts)
 
 print(convert_css_into_c_array(hv))
 print(convert_css_into_c_array(emp))
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
 from dataclasses import dataclass
+from functools import lru_cache
+import ctypes
 import struct
+import threading
 from collections import namedtuple
 import webbrowser
 import pywinusb.hid as hid
@@ -9,27 +12,28 @@ import wx
 # import wx.lib.mixins.inspection
 from usb_hid_keys import USB_HID_KEYS
 from usb_hid_keys import USB_HID_KEYCODES
-
-ArcinConfig = namedtuple(
-    "ArcinConfig",
-    "label flags qe1_sens qe2_sens "
-    "debounce_ticks keycodes "
-    "remap_start_sel remap_b8_b9 "
-    "rgb_flags "
-    "rgb_red rgb_green rgb_blue "
-    "rgb_darkness "
-    "rgb_red_2 rgb_green_2 rgb_blue_2 "
-    "rgb_red_3 rgb_green_3 rgb_blue_3 "
-    "rgb_mode rgb_num_leds rgb_idle_speed "
-    "rgb_idle_brightness rgb_tt_speed rgb_mode_options"
-    )
+from usb_hid_keys import USB_HID_KEY_NAMES
+from usb_hid_keys import USB_HID_KEYCODE_LIST
+
+ArcinConfig = namedtuple("ArcinConfig", (
+        "label", "flags", "qe1_sens", "qe2_sens",
+        "debounce_ticks", "keycodes",
+        "remap_start_sel", "remap_b8_b9",
+        "rgb_flags",
+        "rgb_red", "rgb_green", "rgb_blue",
+        "rgb_darkness",
+        "rgb_red_2", "rgb_green_2", "rgb_blue_2",
+        "rgb_red_3", "rgb_green_3", "rgb_blue_3",
+        "rgb_mode", "rgb_num_leds", "rgb_idle_speed",
+        "rgb_idle_brightness", "rgb_tt_speed", "rgb_mode_options",
+    ))
 
 Rgb = namedtuple("Rgb", "r g b")
 
-RgbConfig = namedtuple(
-    "RgbConfig",
-    "flags rgb1 darkness rgb2 rgb3 mode "
-    "num_leds idle_speed idle_brightness tt_speed mode_options")
+RgbConfig = namedtuple("RgbConfig", (
+        "flags", "rgb1", "darkness", "rgb2", "rgb3", "mode",
+        "num_leds", "idle_speed", "idle_brightness", "tt_speed", "mode_options",
+    ))
 
 ARCIN_CONFIG_VALID_KEYCODES = 13
 ARCIN_RGB_MAX_DARKNESS = 255
@@ -37,11 +41,30 @@ ARCIN_RGB_MAX_DARKNESS = 255
 ARCIN_RGB_NUM_LEDS_MAX = 180
 ARCIN_RGB_NUM_LEDS_DEFAULT = 12
 
+# used when saving before the WS2812B window has ever been opened
+DEFAULT_RGB_CONFIG = RgbConfig(
+    flags=0,
+    rgb1=Rgb(0, 0, 0),
+    darkness=0,
+    rgb2=Rgb(0, 0, 0),
+    rgb3=Rgb(0, 0, 0),
+    mode=0,
+    num_leds=ARCIN_RGB_NUM_LEDS_DEFAULT,
+    idle_speed=0,
+    idle_brightness=0,
+    tt_speed=0,
+    mode_options=0,
+    )
+
 # Infinitas controller VID/PID = 0x1ccf / 0x8048
 VID = 0x1ccf
 PID = 0x8048
 CONFIG_SEGMENT_ID = hid.get_full_usage_id(0xff55, 0xc0ff)
 
+# the filter only holds match criteria; get_devices() re-enumerates each
+# call, so newly plugged-in boards are still picked up
+HID_FILTER = hid.HidDeviceFilter(vendor_id=VID, product_id=PID)
+
 STRUCT_FMT_EX = (
     "12s"  # uint8 label[12]
     "L"    # uint32 flags
@@ -67,6 +90,12 @@ STRUCT_FMT_EX = (
     "B"    # uint8 rgb_mode_options
     "3x")  # uint8 reserved[3]
 
+CONFIG_STRUCT = struct.Struct(STRUCT_FMT_EX)
+
+# report id 0xb0 with command 0x20 restarts the board; never mutated by
+# pywinusb, so a single c_ubyte array is sent as-is every time
+RESTART_FEATURE = (ctypes.c_ubyte * 2)(0xb0, 0x20)
+
 TT_OPTIONS = [
     "Analog only (Infinitas)",
     "Digital only (LR2)",
@@ -91,6 +120,10 @@ SENS_OPTIONS = {
     "16:1": 16
 }
 
+SENS_DEFAULT = -4 # 1:4 is a reasonable default
+SENS_KEYS = list(SENS_OPTIONS.keys())
+SENS_VALUE_TO_INDEX = {v: i for i, v in enumerate(SENS_OPTIONS.values())}
+
 EFFECTOR_NAMES = [
     "E1 (JOY 9)",
     "E2 (JOY 10)",
@@ -105,6 +138,74 @@ DEFAULT_EFFECTOR_MAPPING = [
     4  # b9 = e4
 ]
 
+# keyboard presets, in KeybindsWindowFrame control order
+KEYBINDS_CLEAR = (0,) * ARCIN_CONFIG_VALID_KEYCODES
+
+KEYBINDS_ALL_LETTERS = (
+    # keys
+    USB_HID_KEYS['Z'],
+    USB_HID_KEYS['S'],
+    USB_HID_KEYS['X'],
+    USB_HID_KEYS['D'],
+    USB_HID_KEYS['C'],
+    USB_HID_KEYS['F'],
+    USB_HID_KEYS['V'],
+
+    # E1 - E4
+    USB_HID_KEYS['Q'],
+    USB_HID_KEYS['W'],
+    USB_HID_KEYS['E'],
+    USB_HID_KEYS['R'],
+
+    # TT CW / CCW
+    USB_HID_KEYS['J'],
+    USB_HID_KEYS['K'],
+)
+
+KEYBINDS_DJMAX_1P = (
+    # keys
+    USB_HID_KEYS['Z'],
+    USB_HID_KEYS['S'],
+    USB_HID_KEYS['X'],
+    USB_HID_KEYS['D'],
+    USB_HID_KEYS['C'],
+    USB_HID_KEYS['F'],
+    USB_HID_KEYS['V'],
+
+    # E1 - E4
+    USB_HID_KEYS['ENTER'],
+    USB_HID_KEYS['TAB'],
+    USB_HID_KEYS['SPACE'],
+    USB_HID_KEYS['ESC'],
+
+    # TT CW / CCW
+    USB_HID_KEYS['DOWN'],
+    USB_HID_KEYS['UP'],
+)
+
+KEYBINDS_DJMAX_2P = (
+    # keys
+    USB_HID_KEYS['H'],
+    USB_HID_KEYS['U'],
+    USB_HID_KEYS['J'],
+    USB_HID_KEYS['I'],
+    USB_HID_KEYS['K'],
+    USB_HID_KEYS['O'],
+    USB_HID_KEYS['L'],
+
+    # E1 - E4
+    USB_HID_KEYS['ENTER'],
+    USB_HID_KEYS['TAB'],
+    USB_HID_KEYS['LEFTSHIFT'],
+    USB_HID_KEYS['RIGHTSHIFT'],
+
+    # TT CW / CCW
+    USB_HID_KEYS['RIGHT'],
+    USB_HID_KEYS['LEFT'],
+)
+
+POLL_RATE_OPTIONS = ["1000hz", "250hz"]
+
 INPUT_MODE_OPTIONS = [
     "Controller only (IIDX, BMS)",
     "Keyboard only (DJMAX)",
@@ -217,6 +318,8 @@ RGB_MODE_OPTIONS = [
         ),
 ]
 
+RGB_MODE_NAMES = [mode.display_name for mode in RGB_MODE_OPTIONS]
+
 RGB_TT_FADE_OUT_OPTIONS = [
     "Very quick",
     "Quick",
@@ -241,6 +344,48 @@ ARCIN_CONFIG_FLAG_TT_LED_REACTIVE        = (1 << 11)
 ARCIN_CONFIG_FLAG_TT_LED_HID             = (1 << 12)
 ARCIN_CONFIG_FLAG_WS2812B                = (1 << 13)
 
+# main window checkbox attribute => config flag it controls
+CHECKBOX_FLAGS = (
+    ("multitap_check", ARCIN_CONFIG_FLAG_SEL_MULTI_TAP),
+    ("qe1_invert_check", ARCIN_CONFIG_FLAG_INVERT_QE1),
+    ("debounce_check", ARCIN_CONFIG_FLAG_DEBOUNCE),
+    ("mode_switch_check", ARCIN_CONFIG_FLAG_MODE_SWITCHING_ENABLE),
+    ("led_off_check", ARCIN_CONFIG_FLAG_LED_OFF),
+    ("ws2812b_check", ARCIN_CONFIG_FLAG_WS2812B),
+)
+
+# QE1 turntable mode (index into TT_OPTIONS) => config flags
+TT_MODE_FLAGS = (
+    0,
+    ARCIN_CONFIG_FLAG_DIGITAL_TT_ENABLE,
+    ARCIN_CONFIG_FLAG_DIGITAL_TT_ENABLE | ARCIN_CONFIG_FLAG_ANALOG_TT_FORCE_ENABLE,
+)
+TT_MODE_MASK = (
+    ARCIN_CONFIG_FLAG_DIGITAL_TT_ENABLE | ARCIN_CONFIG_FLAG_ANALOG_TT_FORCE_ENABLE)
+# analog force-enable on its own is not a valid mode; falls back to analog
+TT_MODE_FROM_FLAGS = {f: i for i, f in enumerate(TT_MODE_FLAGS)}
+
+# input mode (index into INPUT_MODE_OPTIONS) => config flags
+INPUT_MODE_FLAGS = (
+    0,
+    ARCIN_CONFIG_FLAG_KEYBOARD_ENABLE | ARCIN_CONFIG_FLAG_JOYINPUT_DISABLE,
+    ARCIN_CONFIG_FLAG_KEYBOARD_ENABLE,
+)
+INPUT_MODE_MASK = (
+    ARCIN_CONFIG_FLAG_KEYBOARD_ENABLE | ARCIN_CONFIG_FLAG_JOYINPUT_DISABLE)
+INPUT_MODE_FROM_FLAGS = {f: i for i, f in enumerate(INPUT_MODE_FLAGS)}
+
+# TT LED mode (index into LED_OPTIONS) => config flags
+LED_MODE_FLAGS = (
+    0,
+    ARCIN_CONFIG_FLAG_TT_LED_REACTIVE,
+    ARCIN_CONFIG_FLAG_TT_LED_HID,
+)
+LED_MODE_MASK = ARCIN_CONFIG_FLAG_TT_LED_REACTIVE | ARCIN_CONFIG_FLAG_TT_LED_HID
+LED_MODE_FROM_FLAGS = {f: i for i, f in enumerate(LED_MODE_FLAGS)}
+# reactive takes priority if both are somehow set
+LED_MODE_FROM_FLAGS[LED_MODE_MASK] = 1
+
 ARCIN_RGB_FLAG_ENABLE_HID                = (1 << 0)
 ARCIN_RGB_FLAG_REACT_TO_TT               = (1 << 1)
 ARCIN_RGB_FLAG_FLIP_DIRECTION            = (1 << 2)
@@ -251,26 +396,50 @@ ARCIN_RGB_FLAG_FLIP_DIRECTION            = (1 << 2)
 ARCIN_RGB_FLAG_FADE_OUT_FAST             = (1 << 3)
 ARCIN_RGB_FLAG_FADE_OUT_SLOW             = (1 << 4)
 
+# RGB_TT_FADE_OUT_OPTIONS index <=> flags
+FADE_OUT_FLAGS = (
+    0,
+    ARCIN_RGB_FLAG_FADE_OUT_FAST,
+    ARCIN_RGB_FLAG_FADE_OUT_SLOW,
+    ARCIN_RGB_FLAG_FADE_OUT_FAST | ARCIN_RGB_FLAG_FADE_OUT_SLOW,
+)
+FADE_OUT_MASK = FADE_OUT_FLAGS[-1]
+FADE_OUT_FROM_FLAGS = {f: i for i, f in enumerate(FADE_OUT_FLAGS)}
+
+def pack_remap(remap):
+    # (start, sel, b8, b9) => (remap_start_sel, remap_b8_b9) config bytes
+    return ((remap[0] << 4) | remap[1], (remap[2] << 4) | remap[3])
+
+def encode_label(label):
+    # the label field is 12 bytes; cut on a character boundary so the
+    # stored label is still valid UTF-8 when it is loaded back
+    return label.encode('utf-8')[0:12].decode('utf-8', 'ignore').encode('utf-8')
+
 def get_devices():
-    hid_filter = hid.HidDeviceFilter(vendor_id=VID, product_id=PID)
-    return hid_filter.get_devices()
+    return HID_FILTER.get_devices()
 
 def load_from_device(device):
     conf = None
     try:
         device.open()
-        for report in device.find_feature_reports():
-            # 0xc0 = 192 = config report
-            if report.report_id == 0xc0:
-
-                print("Loading from device:")
-                print(f"Name:\t {device.product_name}")
-                print(f"Serial:\t {device.serial_number}")
-
-                report.get()
-                conf = parse_device(report)
-
-    except:
+        # 0xc0 = 192 = config report
+        report = next(
+            (r for r in device.find_feature_reports() if r.report_id == 0xc0),
+            None)
+        if report is not None:
+            print("Loading from device:")
+            print(f"Name:\t {device.product_name}")
+            print(f"Serial:\t {device.serial_number}")
+
+            # like HidD_SetFeature, a failed HidD_GetFeature is reported
+            # through the return value (an empty list), not an exception
+            if not report.get():
+                print("Failed to read from device: no config report returned")
+                return None
+            conf = parse_device(report)
+
+    except (hid.HIDError, OSError, KeyError, struct.error) as e:
+        print(f"Failed to read from device: {e}")
         return None
 
     finally:
@@ -280,22 +449,34 @@ def load_from_device(device):
 
 def parse_device(report):
     config_page = report[CONFIG_SEGMENT_ID]
-    data = bytes(config_page.value)
-    expected_size = struct.calcsize(STRUCT_FMT_EX)
-    truncated = bytes(data[0:expected_size])
-    unpacked = struct.unpack(STRUCT_FMT_EX, truncated)
-    return ArcinConfig._make(unpacked)
+    # value_array is the raw c_ubyte storage behind .value (which would
+    # copy it into a list); unpack_from reads it in place and ignores the
+    # trailing padding
+    return ArcinConfig._make(CONFIG_STRUCT.unpack_from(config_page.value_array))
 
 def save_to_device(device, conf):
+    # send_feature_report passes c_ubyte arrays straight through to
+    # HidD_SetFeature; anything else gets copied element by element
+    feature = (ctypes.c_ubyte * 64)()
+
+    # see definition of config_report_t in report_desc.h
+
+    feature[0] = 0xc0 # report id
+    feature[1] = 0x00 # segment
+    feature[2] = 0x3C # size
+    feature[3] = 0x00 # padding
+
+    # "16s" pads / truncates the keycodes to the field size
     try:
-        packed = struct.pack(
-            STRUCT_FMT_EX,
-            conf.label[0:12].encode(),
+        CONFIG_STRUCT.pack_into(
+            feature,
+            4,
+            conf.label,
             conf.flags,
             conf.qe1_sens,
             conf.qe2_sens,
             conf.debounce_ticks,
-            conf.keycodes[0:16],
+            conf.keycodes,
             conf.remap_start_sel,
             conf.remap_b8_b9, 
             conf.rgb_flags,
@@ -316,37 +497,63 @@ def save_to_device(device, conf):
             conf.rgb_tt_speed,
             conf.rgb_mode_options,
             )
-    except:
+    except struct.error as e:
+        print(f"Failed to pack config: {e}")
         return (False, "Format error")
 
     try:
         device.open()
-        feature = [0x00] * 64
-
-        # see definition of config_report_t in report_desc.h
-
-        feature[0] = 0xc0 # report id
-        feature[1] = 0x00 # segment
-        feature[2] = 0x3C # size
-        feature[3] = 0x00 # padding
-        feature[4:4+len(packed)] = packed
-
-        assert len(feature) == 64
 
-        device.send_feature_report(feature)
+        # HidD_SetFeature reports failure through its return value
+        if not device.send_feature_report(feature):
+            return (False, "Failed to write to device")
 
         # restart the board
+        # the board can drop off the bus before the request completes, so
+        # the return value is deliberately ignored; that is the expected
+        # outcome, not a failed save
+        device.send_feature_report(RESTART_FEATURE)
 
-        feature = [0xb0, 0x20]
-        device.send_feature_report(feature)
-
-    except:
+    except (hid.HIDError, OSError) as e:
+        print(f"Failed to write to device: {e}")
         return (False, "Failed to write to device")
     finally:
         device.close()
-        
+
     return (True, "Success")
 
+class DeviceListCtrl(wx.ListCtrl):
+
+    # virtual list control; rows are read from the device list on demand
+    # rather than inserted one at a time
+
+    def __init__(self, *args, **kw):
+        kw['style'] = kw.get('style', 0) | wx.LC_VIRTUAL
+        super().__init__(*args, **kw)
+        self.devices = []
+
+    def set_devices(self, devices):
+        self.devices = devices
+        self.SetItemCount(len(devices))
+        if len(devices) > 0:
+            self.RefreshItems(0, len(devices) - 1)
+
+    def OnGetItemText(self, item, column):
+        device = self.devices[item]
+        if column == 0:
+            return device.product_name
+        else:
+            return device.serial_number
+
+def add_row(panel, grid, row, label, ctrl):
+    label = wx.StaticText(panel, label=label)
+    # put the label right before its control in tab order (z-order on MSW),
+    # same as creating it first; MSW takes the control's accessible name from it
+    label.MoveBeforeInTabOrder(ctrl)
+    grid.Add(label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
+    grid.Add(ctrl, pos=(row, 1), flag=wx.EXPAND)
+    return row + 1
+
 class MainWindowFrame(wx.Frame):
 
     # list of HID devices
@@ -359,6 +566,8 @@ class MainWindowFrame(wx.Frame):
 
     remapper_frame = None
     remap = DEFAULT_EFFECTOR_MAPPING.copy()
+    # remap packed into config bytes; updated whenever remap changes
+    remap_start_sel, remap_b8_b9 = pack_remap(DEFAULT_EFFECTOR_MAPPING)
 
     keybinds_frame = None
     keycodes = None
@@ -386,7 +595,10 @@ class MainWindowFrame(wx.Frame):
 
         box = wx.BoxSizer(wx.VERTICAL)
 
-        self.devices_list = wx.ListCtrl(
+        # build every row before the panel lays out or paints
+        panel.Freeze()
+
+        self.devices_list = DeviceListCtrl(
             panel, style=(wx.LC_REPORT | wx.LC_SINGLE_SEL))
         self.devices_list.AppendColumn("Label", width=120)
         self.devices_list.AppendColumn("Serial #", width=120)
@@ -403,9 +615,9 @@ class MainWindowFrame(wx.Frame):
         self.save_button.Bind(wx.EVT_BUTTON, self.on_save)
         self.load_button = wx.Button(panel, label="Load")
         self.load_button.Bind(wx.EVT_BUTTON, self.on_load)
-        refresh_button = wx.Button(panel, label="Refresh")
-        refresh_button.Bind(wx.EVT_BUTTON, self.on_refresh)
-        button_box.Add(refresh_button, flag=wx.RIGHT, border=4)
+        self.refresh_button = wx.Button(panel, label="Refresh")
+        self.refresh_button.Bind(wx.EVT_BUTTON, self.on_refresh)
+        button_box.Add(self.refresh_button, flag=wx.RIGHT, border=4)
         button_box.Add(self.load_button, flag=wx.RIGHT, border=4)
         button_box.Add(self.save_button)
         box.Add(button_box, flag=wx.ALL, border=4)
@@ -416,18 +628,12 @@ class MainWindowFrame(wx.Frame):
         grid.AddGrowableCol(1)
         row = 0
 
-        title_label = wx.StaticText(panel, label="Label")
         self.title_ctrl = wx.TextCtrl(panel)
         self.title_ctrl.SetMaxLength(11)
-        grid.Add(title_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.title_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "Label", self.title_ctrl)
 
-        fw_label = wx.StaticText(panel, label="Poll rate")
-        self.poll_rate_ctrl = wx.RadioBox(panel, choices=["1000hz", "250hz"])
-        grid.Add(fw_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.poll_rate_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        self.poll_rate_ctrl = wx.RadioBox(panel, choices=POLL_RATE_OPTIONS)
+        row = add_row(panel, grid, row, "Poll rate", self.poll_rate_ctrl)
 
         checklist_label = wx.StaticText(panel, label="Options")
         grid.Add(checklist_label, pos=(row, 0), flag=wx.ALIGN_TOP, border=2)
@@ -435,68 +641,46 @@ class MainWindowFrame(wx.Frame):
         grid.Add(checklist_box, pos=(row, 1), flag=wx.EXPAND)
         row += 1
 
-        debounce_label = wx.StaticText(panel, label="Debounce (ms)")
         self.debounce_ctrl = wx.SpinCtrl(panel, min=2, max=10, initial=2)
-        grid.Add(debounce_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.debounce_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "Debounce (ms)", self.debounce_ctrl)
 
-        qe1_tt_label = wx.StaticText(panel, label="QE1 turntable mode")
         self.qe1_tt_ctrl = wx.Choice(panel, choices=TT_OPTIONS)
         self.qe1_tt_ctrl.Select(0)
-        grid.Add(qe1_tt_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.qe1_tt_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "QE1 turntable mode", self.qe1_tt_ctrl)
 
-        qe1_sens_label = wx.StaticText(panel, label="QE1 sensitivity")
         self.qe1_sens_ctrl = wx.ComboBox(
-            panel, choices=list(SENS_OPTIONS.keys()), style=wx.CB_READONLY)
+            panel, choices=SENS_KEYS, style=wx.CB_READONLY)
         self.qe1_sens_ctrl.Select(0)
-        grid.Add(qe1_sens_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.qe1_sens_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "QE1 sensitivity", self.qe1_sens_ctrl)
 
-        input_mode_label = wx.StaticText(panel, label="Input mode")
         self.input_mode_ctrl = wx.Choice(panel, choices=INPUT_MODE_OPTIONS)
         self.input_mode_ctrl.Select(0)
-        grid.Add(input_mode_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.input_mode_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "Input mode", self.input_mode_ctrl)
 
-        led_mode_label = wx.StaticText(panel, label="TT LED mode")
         self.led_mode_ctrl = wx.Choice(panel, choices=LED_OPTIONS)
         self.led_mode_ctrl.Select(0)
-        grid.Add(led_mode_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.led_mode_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "TT LED mode", self.led_mode_ctrl)
 
-        remapper_label = wx.StaticText(panel, label="Configure gamepad")
         self.remapper_button = wx.Button(panel, label="Open")
         self.remapper_button.Bind(wx.EVT_BUTTON, self.on_remapper_button)
-        grid.Add(remapper_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.remapper_button, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "Configure gamepad", self.remapper_button)
 
-        keybinds_label = wx.StaticText(panel, label="Configure keyboard")
         self.keybinds_button = wx.Button(panel, label="Open")
         self.keybinds_button.Bind(wx.EVT_BUTTON, self.on_keybinds_button)
-        grid.Add(keybinds_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.keybinds_button, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "Configure keyboard", self.keybinds_button)
 
-        rgb_label = wx.StaticText(panel, label="Configure WS2812B")
         self.rgb_button = wx.Button(panel, label="Open")
         self.rgb_button.Bind(wx.EVT_BUTTON, self.on_rgb_button)
-        grid.Add(rgb_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        grid.Add(self.rgb_button, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(panel, grid, row, "Configure WS2812B", self.rgb_button)
 
         box.Add(grid, 1, flag=(wx.EXPAND | wx.ALL), border=8)
 
         panel.SetSizer(box)
+        panel.Thaw()
 
         self.makeMenuBar()
         self.CreateStatusBar()
+        self.Bind(wx.EVT_CLOSE, self.on_close)
 
         self.__evaluate_save_load_buttons__()
         self.__evaluate_controls__()
@@ -570,6 +754,13 @@ These only take in effect while plugged in; they are reset when unplugged""")
         if self.devices_list.GetSelectedItemCount() == 0:
             self.devices_list.Select(index)
 
+    def on_close(self, e):
+        # don't exit in the middle of writing a config to the board
+        if self.loading and e.CanVeto():
+            e.Veto()
+            return
+        e.Skip()
+
     def on_refresh(self, e):
         self.__populate_device_list__()
 
@@ -582,28 +773,40 @@ These only take in effect while plugged in; they are reset when unplugged""")
             return
 
         device = self.devices[index]
-        conf = load_from_device(device)
 
         self.loading = True
         self.__evaluate_save_load_buttons__()
+        self.SetStatusText(
+            f"Reading from {device.product_name} ({device.serial_number})...")
 
-        if conf is not None:
-            self.SetStatusText(
-                f"Reading from {device.product_name} ({device.serial_number})...")
+        # do the HID I/O off the UI thread; the result is posted back
+        threading.Thread(
+            target=self.load_worker, args=(device,), daemon=True).start()
 
-            wx.CallLater(500, self.on_load_deferred, device, conf)
+    def load_worker(self, device):
+        # always post back, even if something unexpected is raised, so the
+        # buttons are re-enabled
+        conf = None
+        try:
+            conf = load_from_device(device)
+        finally:
+            wx.CallAfter(self.on_load_deferred, device, conf)
 
-        else:
+    def on_load_deferred(self, device, conf):
+        self.loading = False
+        if conf is None:
             self.SetStatusText("Error while trying to read from device.")
-            self.loading = False
             self.__evaluate_save_load_buttons__()
+            return
 
-
-    def on_load_deferred(self, device, conf):
-        self.__populate_from_conf__(conf)
-        self.loading = False
-        self.__evaluate_save_load_buttons__()
-        self.__evaluate_controls__()
+        # hold off repainting until every control has its new value
+        self.Freeze()
+        try:
+            self.__populate_from_conf__(conf)
+            self.__evaluate_save_load_buttons__()
+            self.__evaluate_controls__()
+        finally:
+            self.Thaw()
         self.SetStatusText(
             f"Loaded from {device.product_name} ({device.serial_number}).")
 
@@ -616,22 +819,31 @@ These only take in effect while plugged in; they are reset when unplugged""")
         if index < 0:
             return
 
-        device = self.devices[index]       
+        device = self.devices[index]
         conf = self.__extract_conf_from_gui__()
 
         self.loading = True
         self.__evaluate_save_load_buttons__()
         self.SetStatusText(
                 f"Saving to {device.product_name} ({device.serial_number})...")
-        wx.CallLater(500, self.on_save_deferred, device, conf)
 
-    def on_save_deferred(self, device, conf):
+        threading.Thread(
+            target=self.save_worker, args=(device, conf), daemon=True).start()
+
+    def save_worker(self, device, conf):
+        result, error_message = (False, "Unexpected error")
+        try:
+            result, error_message = save_to_device(device, conf)
+        finally:
+            wx.CallAfter(self.on_save_deferred, device, result, error_message)
+
+    def on_save_deferred(self, device, result, error_message):
         self.loading = False
         self.__evaluate_save_load_buttons__()
-        result, error_message = save_to_device(device, conf)
         if result:
             self.SetStatusText(
-                f"Saved to {device.product_name} ({device.serial_number}).")
+                f"Saved to {device.product_name} ({device.serial_number}); "
+                "device restarting.")
         else:
             self.SetStatusText("Error: " + error_message)
 
@@ -668,6 +880,7 @@ These only take in effect while plugged in; they are reset when unplugged""")
     def close_remapper_window(self):
         if self.remapper_frame:
             self.remap = self.remapper_frame.extract_remap_from_ui()
+            self.remap_start_sel, self.remap_b8_b9 = pack_remap(self.remap)
             self.remapper_frame.Destroy()
             self.remapper_frame = None
 
@@ -693,84 +906,34 @@ These only take in effect while plugged in; they are reset when unplugged""")
         self.close_rgb_window()
 
     def __extract_conf_from_gui__(self):
-        title = self.title_ctrl.GetValue()
+        title = encode_label(self.title_ctrl.GetValue())
         flags = 0
-        if self.multitap_check.IsChecked():
-            flags |= ARCIN_CONFIG_FLAG_SEL_MULTI_TAP
-        if self.qe1_invert_check.IsChecked():
-            flags |= ARCIN_CONFIG_FLAG_INVERT_QE1
-        if self.debounce_check.IsChecked():
-            flags |= ARCIN_CONFIG_FLAG_DEBOUNCE
-        if self.mode_switch_check.IsChecked():
-            flags |= ARCIN_CONFIG_FLAG_MODE_SWITCHING_ENABLE
-        if self.led_off_check.IsChecked():
-            flags |= ARCIN_CONFIG_FLAG_LED_OFF
-        if self.ws2812b_check.IsChecked():
-            flags |= ARCIN_CONFIG_FLAG_WS2812B
+        for name, flag in CHECKBOX_FLAGS:
+            if getattr(self, name).IsChecked():
+                flags |= flag
 
         if self.poll_rate_ctrl.GetSelection() == 1:
             flags |= ARCIN_CONFIG_FLAG_250HZ_MODE
 
-        if self.qe1_tt_ctrl.GetSelection() == 1:
-            flags |= ARCIN_CONFIG_FLAG_DIGITAL_TT_ENABLE
-        elif self.qe1_tt_ctrl.GetSelection() == 2:
-            flags |= ARCIN_CONFIG_FLAG_DIGITAL_TT_ENABLE
-            flags |= ARCIN_CONFIG_FLAG_ANALOG_TT_FORCE_ENABLE
-
-        if self.input_mode_ctrl.GetSelection() == 1:
-            # keyboard only
-            flags |= ARCIN_CONFIG_FLAG_KEYBOARD_ENABLE
-            flags |= ARCIN_CONFIG_FLAG_JOYINPUT_DISABLE
-        elif self.input_mode_ctrl.GetSelection() == 2:
-            # both gamepad and keyboard
-            flags |= ARCIN_CONFIG_FLAG_KEYBOARD_ENABLE
-
-        if self.led_mode_ctrl.GetSelection() == 1:
-            flags |= ARCIN_CONFIG_FLAG_TT_LED_REACTIVE
-        elif self.led_mode_ctrl.GetSelection() == 2:
-            flags |= ARCIN_CONFIG_FLAG_TT_LED_HID
+        flags |= TT_MODE_FLAGS[self.qe1_tt_ctrl.GetSelection()]
+
+        flags |= INPUT_MODE_FLAGS[self.input_mode_ctrl.GetSelection()]
+        flags |= LED_MODE_FLAGS[self.led_mode_ctrl.GetSelection()]
             
-        if 2 <= self.debounce_ctrl.GetValue() <= 10:
-            debounce_ticks = self.debounce_ctrl.GetValue()
-        else:
+        debounce_ticks = self.debounce_ctrl.GetValue()
+        if not 2 <= debounce_ticks <= 10:
             debounce_ticks = 2
 
-        if self.qe1_sens_ctrl.GetValue() in SENS_OPTIONS:
-            qe1_sens = SENS_OPTIONS[self.qe1_sens_ctrl.GetValue()]
-        else:
-            qe1_sens = -4 # 1:4: as the reasonable default
+        qe1_sens = SENS_OPTIONS.get(self.qe1_sens_ctrl.GetValue(), SENS_DEFAULT)
 
         if self.keycodes:
             keycodes = bytes(self.keycodes)
         else:
             keycodes = bytes([0] * ARCIN_CONFIG_VALID_KEYCODES)
 
-        remap_start_sel = (self.remap[0] << 4) | self.remap[1]
-        remap_b8_b9 = (self.remap[2] << 4) | self.remap[3]
-
-        rgb_flags = 0
-        rgb_darkness = 0
-        rgb_primary = Rgb(0, 0, 0)
-        rgb_secondary = Rgb(0, 0, 0)
-        rgb_tertiary = Rgb(0, 0, 0)
-        rgb_mode = 0
-        rgb_num_leds = ARCIN_RGB_NUM_LEDS_DEFAULT
-        rgb_idle_speed = 0
-        rgb_idle_brightness = 0
-        rgb_tt_speed = 0
-        rgb_mode_options = 0
-        if self.rgb_config:
-            rgb_flags = self.rgb_config.flags
-            rgb_primary = self.rgb_config.rgb1
-            rgb_darkness = self.rgb_config.darkness
-            rgb_secondary = self.rgb_config.rgb2
-            rgb_tertiary = self.rgb_config.rgb3
-            rgb_mode = self.rgb_config.mode
-            rgb_num_leds = self.rgb_config.num_leds
-            rgb_idle_speed = self.rgb_config.idle_speed
-            rgb_idle_brightness = self.rgb_config.idle_brightness
-            rgb_tt_speed = self.rgb_config.tt_speed
-            rgb_mode_options = self.rgb_config.mode_options
+        (rgb_flags, rgb_primary, rgb_darkness, rgb_secondary, rgb_tertiary,
+         rgb_mode, rgb_num_leds, rgb_idle_speed, rgb_idle_brightness,
+         rgb_tt_speed, rgb_mode_options) = self.rgb_config or DEFAULT_RGB_CONFIG
 
         conf = ArcinConfig(
             label=title,
@@ -779,8 +942,8 @@ These only take in effect while plugged in; they are reset when unplugged""")
             qe2_sens=0,
             debounce_ticks=debounce_ticks,
             keycodes=keycodes,
-            remap_start_sel=remap_start_sel,
-            remap_b8_b9=remap_b8_b9,
+            remap_start_sel=self.remap_start_sel,
+            remap_b8_b9=self.remap_b8_b9,
             rgb_flags=rgb_flags,
             rgb_red=rgb_primary.r,
             rgb_green=rgb_primary.g,
@@ -806,69 +969,35 @@ These only take in effect while plugged in; they are reset when unplugged""")
         # "label flags qe1_sens qe2_sens effector_mode debounce_ticks")
         self.title_ctrl.SetValue(conf.label)
 
-        self.multitap_check.SetValue(
-            bool(conf.flags & ARCIN_CONFIG_FLAG_SEL_MULTI_TAP))
-
-        self.qe1_invert_check.SetValue(
-            bool(conf.flags & ARCIN_CONFIG_FLAG_INVERT_QE1))
-
-        self.debounce_check.SetValue(
-            bool(conf.flags & ARCIN_CONFIG_FLAG_DEBOUNCE))
-
-        self.mode_switch_check.SetValue(
-            bool(conf.flags & ARCIN_CONFIG_FLAG_MODE_SWITCHING_ENABLE))
-
-        self.led_off_check.SetValue(
-            bool(conf.flags & ARCIN_CONFIG_FLAG_LED_OFF))
-
-        self.ws2812b_check.SetValue(
-            bool(conf.flags & ARCIN_CONFIG_FLAG_WS2812B))
+        for name, flag in CHECKBOX_FLAGS:
+            getattr(self, name).SetValue(bool(conf.flags & flag))
 
         if conf.flags & ARCIN_CONFIG_FLAG_250HZ_MODE:
             self.poll_rate_ctrl.Select(1)
         else:
             self.poll_rate_ctrl.Select(0)
 
-        if (conf.flags & ARCIN_CONFIG_FLAG_DIGITAL_TT_ENABLE and
-            conf.flags & ARCIN_CONFIG_FLAG_ANALOG_TT_FORCE_ENABLE):
-            self.qe1_tt_ctrl.Select(2)
-        elif conf.flags & ARCIN_CONFIG_FLAG_DIGITAL_TT_ENABLE:
-            self.qe1_tt_ctrl.Select(1)
-        else:
-            self.qe1_tt_ctrl.Select(0)
-
-        if (conf.flags & ARCIN_CONFIG_FLAG_KEYBOARD_ENABLE and
-            conf.flags & ARCIN_CONFIG_FLAG_JOYINPUT_DISABLE):
-            self.input_mode_ctrl.Select(1)
-        elif conf.flags & ARCIN_CONFIG_FLAG_KEYBOARD_ENABLE:
-            self.input_mode_ctrl.Select(2)
-        else:
-            self.input_mode_ctrl.Select(0)
-
-        if conf.flags & ARCIN_CONFIG_FLAG_TT_LED_REACTIVE:
-            self.led_mode_ctrl.Select(1)
-        elif conf.flags & ARCIN_CONFIG_FLAG_TT_LED_HID:
-            self.led_mode_ctrl.Select(2)
-        else:
-            self.led_mode_ctrl.Select(0)
+        self.qe1_tt_ctrl.Select(
+            TT_MODE_FROM_FLAGS.get(conf.flags & TT_MODE_MASK, 0))
+        self.input_mode_ctrl.Select(
+            INPUT_MODE_FROM_FLAGS.get(conf.flags & INPUT_MODE_MASK, 0))
+        self.led_mode_ctrl.Select(
+            LED_MODE_FROM_FLAGS.get(conf.flags & LED_MODE_MASK, 0))
 
         self.debounce_ctrl.SetValue(conf.debounce_ticks)
 
-        index = -4 # 1:4 is a reasonable default
-        for i, value in enumerate(SENS_OPTIONS.values()):
-            if conf.qe1_sens == value:
-                index = i
-                break
+        index = SENS_VALUE_TO_INDEX.get(
+            conf.qe1_sens, SENS_VALUE_TO_INDEX[SENS_DEFAULT])
         self.qe1_sens_ctrl.Select(index)
 
-        self.keycodes = []
-        for c in conf.keycodes:
-            self.keycodes.append(c)
+        self.keycodes = list(conf.keycodes)
 
         self.remap[0] = (conf.remap_start_sel >> 4) & 0xF
         self.remap[1] = conf.remap_start_sel & 0xF
         self.remap[2] = (conf.remap_b8_b9 >> 4) & 0xF
         self.remap[3] = conf.remap_b8_b9 & 0xF
+        self.remap_start_sel = conf.remap_start_sel
+        self.remap_b8_b9 = conf.remap_b8_b9
 
         self.rgb_config = RgbConfig(
             conf.rgb_flags,
@@ -890,11 +1019,35 @@ These only take in effect while plugged in; they are reset when unplugged""")
         
         self.devices_list.DeleteAllItems()
         self.__evaluate_save_load_buttons__()
-        self.devices = get_devices()
-        for d in self.devices:
-            self.devices_list.Append([d.product_name, d.serial_number])
-        if len(self.devices) > 0:
-            self.devices_list.Select(0)
+        self.SetStatusText("Searching for devices...")
+
+        # HID enumeration can be slow; keep it off the UI thread, and only
+        # run one at a time so an older result can't overwrite a newer one
+        self.refresh_button.Disable()
+        threading.Thread(target=self.enumerate_worker, daemon=True).start()
+
+    def enumerate_worker(self):
+        # always post back so Refresh is re-enabled, whatever goes wrong
+        devices = []
+        try:
+            devices = get_devices()
+        except (hid.HIDError, OSError) as e:
+            print(f"Failed to enumerate devices: {e}")
+        finally:
+            wx.CallAfter(self.on_enumerate_deferred, devices)
+
+    def on_enumerate_deferred(self, devices):
+        self.refresh_button.Enable()
+        self.devices = devices
+
+        # suppress repaints until the list is fully repopulated
+        self.devices_list.Freeze()
+        try:
+            self.devices_list.set_devices(self.devices)
+            if len(self.devices) > 0:
+                self.devices_list.Select(0)
+        finally:
+            self.devices_list.Thaw()
 
         self.SetStatusText(f"Found {len(self.devices)} device(s).")
 
@@ -903,12 +1056,9 @@ These only take in effect while plugged in; they are reset when unplugged""")
         self.rgb_button.Enable(self.ws2812b_check.IsChecked())
 
     def __evaluate_save_load_buttons__(self):
-        if self.devices_list.GetFirstSelected() >= 0 and not self.loading:
-            self.save_button.Enable(True)
-            self.load_button.Enable(True)
-        else:
-            self.save_button.Enable(False)
-            self.load_button.Enable(False)
+        enabled = self.devices_list.GetFirstSelected() >= 0 and not self.loading
+        self.save_button.Enable(enabled)
+        self.load_button.Enable(enabled)
 
 class KeybindsWindowFrame(wx.Frame):
 
@@ -916,8 +1066,8 @@ class KeybindsWindowFrame(wx.Frame):
     grid = None
     row = 0
 
-    # controls
-    controls_list = []
+    # controls; assigned per instance in __init__
+    controls_list = None
 
     def __init__(self, *args, **kw):
         default_size = (320, 550)
@@ -940,6 +1090,8 @@ class KeybindsWindowFrame(wx.Frame):
         self.SetMinSize(default_size)
         box = wx.BoxSizer(wx.VERTICAL)
 
+        self.panel.Freeze()
+
         label = wx.StaticText(self.panel,
             label="Use any of the presets from the menu above, or configure each key below.")
         label.Wrap(default_size[0] - 20)
@@ -972,6 +1124,7 @@ class KeybindsWindowFrame(wx.Frame):
 
         box.Add(self.grid, 1, flag=(wx.EXPAND | wx.ALL), border=8)
         self.panel.SetSizer(box)
+        self.panel.Thaw()
         self.makeMenuBar()
 
     def makeMenuBar(self):
@@ -991,107 +1144,39 @@ class KeybindsWindowFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self.on_preset_2p, player_2_item)
 
     def on_clear_all(self, e):
-        keycodes = [0] * ARCIN_CONFIG_VALID_KEYCODES
-        self.populate_ui_from_keycodes(keycodes)
+        self.populate_ui_from_keycodes(KEYBINDS_CLEAR)
 
     def on_buttons(self, e):
-        keycodes = [
-            # keys
-            USB_HID_KEYS['Z'],
-            USB_HID_KEYS['S'],
-            USB_HID_KEYS['X'],
-            USB_HID_KEYS['D'],
-            USB_HID_KEYS['C'],
-            USB_HID_KEYS['F'],
-            USB_HID_KEYS['V'],
-
-            # E1 - E4
-            USB_HID_KEYS['Q'],
-            USB_HID_KEYS['W'],
-            USB_HID_KEYS['E'],
-            USB_HID_KEYS['R'],
-
-            # TT CW / CCW
-            USB_HID_KEYS['J'],
-            USB_HID_KEYS['K'],
-        ]
-
-        self.populate_ui_from_keycodes(keycodes)
+        self.populate_ui_from_keycodes(KEYBINDS_ALL_LETTERS)
 
     def on_preset_1p(self, e):
-        keycodes = [
-            # keys
-            USB_HID_KEYS['Z'],
-            USB_HID_KEYS['S'],
-            USB_HID_KEYS['X'],
-            USB_HID_KEYS['D'],
-            USB_HID_KEYS['C'],
-            USB_HID_KEYS['F'],
-            USB_HID_KEYS['V'],
-
-            # E1 - E4
-            USB_HID_KEYS['ENTER'],
-            USB_HID_KEYS['TAB'],
-            USB_HID_KEYS['SPACE'],
-            USB_HID_KEYS['ESC'],
-
-            # TT CW / CCW
-            USB_HID_KEYS['DOWN'],
-            USB_HID_KEYS['UP'],
-        ]
-
-        self.populate_ui_from_keycodes(keycodes)
+        self.populate_ui_from_keycodes(KEYBINDS_DJMAX_1P)
 
     def on_preset_2p(self, e):
-        keycodes = [
-            # keys
-            USB_HID_KEYS['H'],
-            USB_HID_KEYS['U'],
-            USB_HID_KEYS['J'],
-            USB_HID_KEYS['I'],
-            USB_HID_KEYS['K'],
-            USB_HID_KEYS['O'],
-            USB_HID_KEYS['L'],
-
-            # E1 - E4
-            USB_HID_KEYS['ENTER'],
-            USB_HID_KEYS['TAB'],
-            USB_HID_KEYS['LEFTSHIFT'],
-            USB_HID_KEYS['RIGHTSHIFT'],
-
-            # TT CW / CCW
-            USB_HID_KEYS['RIGHT'],
-            USB_HID_KEYS['LEFT'],
-        ]
-        self.populate_ui_from_keycodes(keycodes)
+        self.populate_ui_from_keycodes(KEYBINDS_DJMAX_2P)
 
     def populate_ui_from_keycodes(self, keycodes):
 
         assert len(self.controls_list) <= len(keycodes)
         assert len(self.controls_list) == ARCIN_CONFIG_VALID_KEYCODES
 
-        for i, c in enumerate(self.controls_list):
-            keycode = keycodes[i]
-            if keycode in USB_HID_KEYCODES:
-                c.Select(USB_HID_KEYCODES[keycode])
-            else:
-                c.Select(0)
+        get_index = USB_HID_KEYCODES.get
+        for c, keycode in zip(self.controls_list, keycodes):
+            index = get_index(keycode, 0)
+            # presets often leave most keys as they were
+            if c.GetSelection() != index:
+                c.Select(index)
 
     def extract_keycodes_from_ui(self):
 
         assert len(self.controls_list) == ARCIN_CONFIG_VALID_KEYCODES
 
-        extracted_keycodes = []
-        keycodes = list(USB_HID_KEYCODES.keys())
-        for c in self.controls_list:
-            selected_index = c.GetSelection()
-            extracted_keycodes.append(keycodes[selected_index])
-    
-        return extracted_keycodes
+        keycode_list = USB_HID_KEYCODE_LIST
+        return [keycode_list[c.GetSelection()] for c in self.controls_list]
 
     def __create_button__(self, label):
         label = wx.StaticText(self.panel, label=label)
-        combobox = wx.Choice(self.panel, choices=list(USB_HID_KEYS.keys()))
+        combobox = wx.Choice(self.panel, choices=USB_HID_KEY_NAMES)
         self.controls_list.append(combobox)
         combobox.Select(0)
         self.grid.Add(label, pos=(self.row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
@@ -1109,6 +1194,9 @@ class RemapperWindowFrame(wx.Frame):
     remap_b8_ctrl = None
     remap_b9_ctrl = None
 
+    # in remap order: start, select, b8, b9
+    remap_ctrls = ()
+
     def __init__(self, *args, **kw):
         default_size = (300, 200)
         kw['size'] = default_size
@@ -1130,64 +1218,53 @@ class RemapperWindowFrame(wx.Frame):
         self.SetMinSize(default_size)
         box = wx.BoxSizer(wx.VERTICAL)
 
+        self.panel.Freeze()
+
         self.grid = wx.GridBagSizer(10, 10)
         self.grid.SetCols(2)
         self.grid.AddGrowableCol(1)
-        row = 0    
+        row = 0
 
         self.remap_start_ctrl = wx.Choice(self.panel, choices=EFFECTOR_NAMES)
-        self.grid.Add(
-            wx.StaticText(self.panel, label="Start Button"),
-            pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.remap_start_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Start Button", self.remap_start_ctrl)
 
         self.remap_select_ctrl = wx.Choice(self.panel, choices=EFFECTOR_NAMES)
-        self.grid.Add(
-            wx.StaticText(self.panel, label="Select Button"),
-            pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.remap_select_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Select Button", self.remap_select_ctrl)
 
         self.remap_b8_ctrl = wx.Choice(self.panel, choices=EFFECTOR_NAMES)
-        self.grid.Add(
-            wx.StaticText(self.panel, label="Button 8"),
-            pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.remap_b8_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Button 8", self.remap_b8_ctrl)
 
         self.remap_b9_ctrl = wx.Choice(self.panel, choices=EFFECTOR_NAMES)
-        self.grid.Add(
-            wx.StaticText(self.panel, label="Button 9"),
-            pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.remap_b9_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
-    
+        row = add_row(self.panel, self.grid, row, "Button 9", self.remap_b9_ctrl)
+
+        self.remap_ctrls = (
+            self.remap_start_ctrl,
+            self.remap_select_ctrl,
+            self.remap_b8_ctrl,
+            self.remap_b9_ctrl,
+        )
+
         box.Add(self.grid, 1, flag=(wx.EXPAND | wx.ALL), border=8)
         self.panel.SetSizer(box)
 
         if remap is not None:
             self.populate_ui_from_remap(remap)
 
-    def populate_ui_from_remap(self, remap):
-        for i, value in enumerate(remap):
-            if value == 0:
-                remap[i] = DEFAULT_EFFECTOR_MAPPING[i]
+        self.panel.Thaw()
 
-        self.remap_start_ctrl.Select(remap[0] - 1)
-        self.remap_select_ctrl.Select(remap[1] - 1)
-        self.remap_b8_ctrl.Select(remap[2] - 1)
-        self.remap_b9_ctrl.Select(remap[3] - 1)
+    def populate_ui_from_remap(self, remap):
+        # 0 means "use the default mapping" for that button
+        for c, value, default in zip(
+                self.remap_ctrls, remap, DEFAULT_EFFECTOR_MAPPING):
+            index = (value or default) - 1
+            if c.GetSelection() != index:
+                c.Select(index)
 
     def extract_remap_from_ui(self):
-        remap = [
-            self.remap_start_ctrl.GetSelection() + 1,
-            self.remap_select_ctrl.GetSelection() + 1,
-            self.remap_b8_ctrl.GetSelection() + 1,
-            self.remap_b9_ctrl.GetSelection() + 1,
-        ]
-        return remap
+        return [c.GetSelection() + 1 for c in self.remap_ctrls]
 
+# SetColour copies its argument, so handing out a shared wx.Colour is safe
+@lru_cache(maxsize=256)
 def wxcolour_from_rgb(rgb):
     return wx.Colour(rgb.r, rgb.g, rgb.b)
 
@@ -1221,15 +1298,14 @@ class RgbWindowFrame(wx.Frame):
         self.SetMinSize(default_size)
         box = wx.BoxSizer(wx.VERTICAL)
 
+        self.panel.Freeze()
+
         self.grid = wx.GridBagSizer(10, 10)
         self.grid.SetCols(2)
         self.grid.AddGrowableCol(1)
         row = 0
 
-        self.grid.Add(
-            self.__make_header_text__("LED configuration"),
-            pos=(row, 0), span=(1, 2), flag=wx.ALIGN_CENTER_VERTICAL)        
-        row += 1
+        row = self.__add_header__(row, "LED configuration")
 
         checklist_label = wx.StaticText(self.panel, label="Options")
         self.grid.Add(checklist_label, pos=(row, 0), flag=wx.ALIGN_TOP, border=2)
@@ -1237,42 +1313,23 @@ class RgbWindowFrame(wx.Frame):
         self.grid.Add(checklist_box, pos=(row, 1), flag=wx.EXPAND)
         row += 1
 
-        num_leds_label = wx.StaticText(self.panel, label="Number of LEDs (max 180)")
         self.num_leds_slider = wx.SpinCtrl(
             self.panel, style=wx.SL_VALUE_LABEL,
             min=1, max=ARCIN_RGB_NUM_LEDS_MAX, initial=ARCIN_RGB_NUM_LEDS_DEFAULT)
-        self.grid.Add(num_leds_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.num_leds_slider, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Number of LEDs (max 180)", self.num_leds_slider)
 
-        intensity_label = wx.StaticText(self.panel, label="Overall brightness")
         self.intensity_slider = wx.Slider(
             self.panel, style=wx.SL_VALUE_LABEL, minValue=0, maxValue=ARCIN_RGB_MAX_DARKNESS)
-        self.intensity_slider.SetTickFreq = 1
         self.intensity_slider.SetValue(ARCIN_RGB_MAX_DARKNESS)
-        self.grid.Add(intensity_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.intensity_slider, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
-
-        self.grid.Add(
-            self.__make_line__(),
-            pos=(row, 0), span=(1, 2), flag=(wx.ALIGN_CENTER_VERTICAL | wx.EXPAND))
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Overall brightness", self.intensity_slider)
 
-        self.grid.Add(
-            self.__make_header_text__("Color mode"),
-            pos=(row, 0), span=(1, 2), flag=wx.ALIGN_CENTER_VERTICAL)
-        row += 1
+        row = self.__add_line__(row)
+        row = self.__add_header__(row, "Color mode")
 
-        led_mode_label = wx.StaticText(self.panel, label="Color mode")
-        self.led_mode_ctrl = wx.Choice(
-            self.panel,
-            choices=[mode.display_name for mode in RGB_MODE_OPTIONS])
+        self.led_mode_ctrl = wx.Choice(self.panel, choices=RGB_MODE_NAMES)
         self.led_mode_ctrl.Select(0)
         self.led_mode_ctrl.Bind(wx.EVT_CHOICE, self.__evaluate_controls__)
-        self.grid.Add(led_mode_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.led_mode_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Color mode", self.led_mode_ctrl)
 
         self.multiplicity_label = wx.StaticText(self.panel, label="")
         self.multiplicity_slider = wx.SpinCtrl(
@@ -1284,19 +1341,14 @@ class RgbWindowFrame(wx.Frame):
         row += 1
 
         self.idle_speed_label = wx.StaticText(self.panel, label="")
-        self.grid.Add(self.idle_speed_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)        
-
         self.idle_speed_slider = wx.Slider(self.panel, minValue=0, maxValue=240)
-        self.idle_speed_slider.SetTickFreq = 1
         self.idle_speed_slider.SetValue(0)
         self.idle_speed_slider.Bind(wx.EVT_SLIDER, self.__evaluate_idle_speed__)
+        self.grid.Add(self.idle_speed_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
         self.grid.Add(self.idle_speed_slider, pos=(row, 1), flag=wx.EXPAND)
         row += 1
-        
-        self.grid.Add(
-            self.__make_line__(),
-            pos=(row, 0), span=(1, 2), flag=(wx.ALIGN_CENTER_VERTICAL | wx.EXPAND))
-        row += 1
+
+        row = self.__add_line__(row)
 
         self.grid.Add(
             self.__make_header_text__("Colors"),
@@ -1306,12 +1358,9 @@ class RgbWindowFrame(wx.Frame):
         self.grid.Add(self.rgb_reset_button, pos=(row, 1), flag=wx.ALIGN_RIGHT)
         row += 1
 
-        self.palette_label = wx.StaticText(self.panel, label="Color palette")
         self.palette_ctrl = wx.Choice(self.panel, choices=RGB_TT_PALETTES)
         self.palette_ctrl.Bind(wx.EVT_CHOICE, self.__evaluate_controls__)
-        self.grid.Add(self.palette_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.palette_ctrl, pos=(row, 1), flag=wx.EXPAND)        
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Color palette", self.palette_ctrl)
 
         color_swatch_label = wx.StaticText(self.panel, label="Colors")
         self.grid.Add(color_swatch_label, pos=(row, 0), flag=wx.ALIGN_TOP, border=2)
@@ -1321,15 +1370,8 @@ class RgbWindowFrame(wx.Frame):
 
         self.on_rgb_reset_button()
 
-        self.grid.Add(
-            self.__make_line__(),
-            pos=(row, 0), span=(1, 2), flag=(wx.ALIGN_CENTER_VERTICAL | wx.EXPAND))
-        row += 1
-
-        self.grid.Add(
-            self.__make_header_text__("Reactive turntable mode"),
-            pos=(row, 0), span=(1, 2), flag=wx.ALIGN_CENTER_VERTICAL)
-        row += 1
+        row = self.__add_line__(row)
+        row = self.__add_header__(row, "Reactive turntable mode")
 
         checklist_label = wx.StaticText(self.panel, label="Options")
         self.grid.Add(checklist_label, pos=(row, 0), flag=wx.ALIGN_TOP, border=2)
@@ -1339,28 +1381,20 @@ class RgbWindowFrame(wx.Frame):
 
         self.tt_speed_label = wx.StaticText(self.panel, label="TT speed")
         self.tt_speed_slider = wx.Slider(self.panel, minValue=-100, maxValue=100)
-        self.tt_speed_slider.SetTickFreq = 1
         self.tt_speed_slider.SetValue(0)
         self.tt_speed_slider.Bind(wx.EVT_SLIDER, self.__evaluate_tt_speed__)
         self.grid.Add(self.tt_speed_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
         self.grid.Add(self.tt_speed_slider, pos=(row, 1), flag=wx.EXPAND)
         row += 1
 
-        fadeout_label = wx.StaticText(self.panel, label="Fade out speed")
         self.fadeout_ctrl = wx.Choice(self.panel, choices=RGB_TT_FADE_OUT_OPTIONS)
         self.fadeout_ctrl.Select(0)
-        self.grid.Add(fadeout_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.fadeout_ctrl, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Fade out speed", self.fadeout_ctrl)
 
-        idle_intensity_label = wx.StaticText(self.panel, label="Minimum brightness")
         self.idle_intensity_slider = wx.Slider(
             self.panel, style=wx.SL_VALUE_LABEL, minValue=0, maxValue=ARCIN_RGB_MAX_DARKNESS)
-        self.idle_intensity_slider.SetTickFreq = 1
         self.idle_intensity_slider.SetValue(0)
-        self.grid.Add(idle_intensity_label, pos=(row, 0), flag=wx.ALIGN_CENTER_VERTICAL)
-        self.grid.Add(self.idle_intensity_slider, pos=(row, 1), flag=wx.EXPAND)
-        row += 1
+        row = add_row(self.panel, self.grid, row, "Minimum brightness", self.idle_intensity_slider)
 
         box.Add(self.grid, 1, flag=(wx.EXPAND | wx.ALL), border=8)
         self.panel.SetSizer(box)
@@ -1369,15 +1403,17 @@ class RgbWindowFrame(wx.Frame):
             self.populate_ui(rgb_config)
 
         self.__evaluate_controls__()
+        self.panel.Thaw()
 
     def populate_ui(self, config):
         # do this first so ranges are properly populated
         self.led_mode_ctrl.Select(config.mode)
         self.__evaluate_controls__()
 
-        self.hid_rgb_check.SetValue(bool(config.flags & ARCIN_RGB_FLAG_ENABLE_HID))
-        self.qe1_react_check.SetValue(bool(config.flags & ARCIN_RGB_FLAG_REACT_TO_TT))
-        self.flip_direction_check.SetValue(bool(config.flags & ARCIN_RGB_FLAG_FLIP_DIRECTION))
+        flags = config.flags
+        self.hid_rgb_check.SetValue(bool(flags & ARCIN_RGB_FLAG_ENABLE_HID))
+        self.qe1_react_check.SetValue(bool(flags & ARCIN_RGB_FLAG_REACT_TO_TT))
+        self.flip_direction_check.SetValue(bool(flags & ARCIN_RGB_FLAG_FLIP_DIRECTION))
         self.intensity_slider.SetValue(ARCIN_RGB_MAX_DARKNESS - config.darkness)
         self.idle_intensity_slider.SetValue(config.idle_brightness)
 
@@ -1392,16 +1428,10 @@ class RgbWindowFrame(wx.Frame):
         else:
             self.num_leds_slider.SetValue(config.num_leds)
 
-        fadeout_value = 0
-        if config.flags & ARCIN_RGB_FLAG_FADE_OUT_FAST:
-            fadeout_value |= 0x1
-        if config.flags & ARCIN_RGB_FLAG_FADE_OUT_SLOW:
-            fadeout_value |= 0x2
-        self.fadeout_ctrl.Select(fadeout_value)
+        self.fadeout_ctrl.Select(FADE_OUT_FROM_FLAGS[flags & FADE_OUT_MASK])
 
         self.idle_speed_slider.SetValue(config.idle_speed)
         self.tt_speed_slider.SetValue(config.tt_speed)
-        pass
 
     def extract_from_ui(self):
         flags = 0
@@ -1412,11 +1442,7 @@ class RgbWindowFrame(wx.Frame):
         if self.flip_direction_check.IsChecked():
             flags |= ARCIN_RGB_FLAG_FLIP_DIRECTION
 
-        fadeout = self.fadeout_ctrl.GetSelection()
-        if fadeout & 0x2:
-            flags |= ARCIN_RGB_FLAG_FADE_OUT_SLOW
-        if fadeout & 0x1:
-            flags |= ARCIN_RGB_FLAG_FADE_OUT_FAST
+        flags |= FADE_OUT_FLAGS[self.fadeout_ctrl.GetSelection()]
 
         intensity = ARCIN_RGB_MAX_DARKNESS - self.intensity_slider.GetValue()
 
@@ -1447,6 +1473,18 @@ class RgbWindowFrame(wx.Frame):
         self.rgb3_button.SetColour(wx.Colour(0, 0, 255))
         self.palette_ctrl.Select(0)
 
+    def __add_header__(self, row, text):
+        self.grid.Add(
+            self.__make_header_text__(text),
+            pos=(row, 0), span=(1, 2), flag=wx.ALIGN_CENTER_VERTICAL)
+        return row + 1
+
+    def __add_line__(self, row):
+        self.grid.Add(
+            self.__make_line__(),
+            pos=(row, 0), span=(1, 2), flag=(wx.ALIGN_CENTER_VERTICAL | wx.EXPAND))
+        return row + 1
+
     def __make_line__(self):
         line = wx.StaticLine(self.panel, size=wx.Size(1, 1), style=wx.LI_HORIZONTAL)
         return line
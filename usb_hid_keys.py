@@ -119,3 +119,7 @@ for i, (k, v) in enumerate(USB_HID_KEYS.items()):
     assert v not in USB_HID_KEYCODES
 
     USB_HID_KEYCODES[v] = i
+
+# index in USB_HID_KEYS => key name / keycode
+USB_HID_KEY_NAMES = list(USB_HID_KEYS.keys())
+USB_HID_KEYCODE_LIST = tuple(USB_HID_KEYS.values())